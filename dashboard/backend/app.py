@@ -7,24 +7,232 @@ This Flask application serves data from the Bayesian change point analysis
 and provides APIs for the React frontend dashboard.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, make_response, request
 from flask_cors import CORS
+from flask_compress import Compress
+from flask_orjson import OrjsonProvider
+import orjson
+import pyarrow as pa
+import pyarrow.ipc as ipc
 import pandas as pd
 import numpy as np
-import json
+import math
+from numba import njit
 from datetime import datetime, timedelta
+from functools import lru_cache
+import gzip
 import os
+import re
 import sys
+import time
 
 # Add parent directory to path to import analysis modules
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
+
+def _json_default(obj):
+    """Serialize pandas objects that orjson does not handle natively"""
+    if isinstance(obj, pd.Timestamp):
+        return obj.strftime('%Y-%m-%d')
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+def dump_json(obj):
+    """Serialize an object to JSON bytes using the app's orjson settings"""
+    return orjson.dumps(obj, option=ORJSON_OPTIONS, default=_json_default)
+
+
+class CachedPayload:
+    """Pre-serialized JSON response body, with a gzip-compressed copy"""
+    
+    def __init__(self, obj):
+        self.body = dump_json(obj)
+        self.gzipped = gzip.compress(self.body)
+
+
+class NumpyOrjsonProvider(OrjsonProvider):
+    """orjson-backed JSON provider that passes numpy scalars and arrays through"""
+    option = ORJSON_OPTIONS
+    default = staticmethod(_json_default)
+
+
 app = Flask(__name__)
+app.json = NumpyOrjsonProvider(app)
 CORS(app)  # Enable CORS for React frontend
 
 # Configuration
 app.config['JSON_SORT_KEYS'] = False
-app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True
+app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
+app.config['COMPRESS_MIN_SIZE'] = 2048
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+# Streamed responses (large oil price ranges) must cover gzip-only clients too
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'gzip']
+
+
+class AcceptingCompress(Compress):
+    """Flask-Compress that honours q=0 (refused) codings in Accept-Encoding"""
+    
+    def after_request(self, response):
+        # Flask-Compress treats any listed coding as acceptable, even with q=0,
+        # so only show it the codings the client actually accepts
+        environ = request.environ
+        original = environ.get('HTTP_ACCEPT_ENCODING')
+        environ['HTTP_ACCEPT_ENCODING'] = ', '.join(
+            f'{coding};q={quality}' for coding, quality in request.accept_encodings if quality > 0
+        )
+        try:
+            return super().after_request(response)
+        finally:
+            if original is None:
+                del environ['HTTP_ACCEPT_ENCODING']
+            else:
+                environ['HTTP_ACCEPT_ENCODING'] = original
+
+
+AcceptingCompress(app)  # Compress JSON responses for clients that accept it
+
+
+def cached_json_response(payload):
+    """Build a response from a CachedPayload, reusing its gzip body when accepted"""
+    if len(payload.body) >= app.config['COMPRESS_MIN_SIZE'] and request.accept_encodings['gzip'] > 0:
+        response = app.response_class(payload.gzipped, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+        return response
+    return app.response_class(payload.body, mimetype='application/json')
+
+# Absolute ISO 8601 dates/timestamps, the only inputs safe to memoize
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}([T ]\d{2}(:\d{2}){0,2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?')
+
+
+def _date_to_i8(date):
+    """Parse a date string to int64 nanoseconds since the epoch
+    
+    Dates outside the nanosecond range (1677-2262) are clamped to its ends,
+    so they still compare correctly against the date index.
+    """
+    timestamp = pd.Timestamp(date)
+    if timestamp is pd.NaT:
+        raise ValueError(f"Invalid date: {date!r}")
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert(None)
+    if timestamp < pd.Timestamp.min:
+        return int(np.iinfo(np.int64).min)
+    if timestamp > pd.Timestamp.max:
+        return int(np.iinfo(np.int64).max)
+    return int(timestamp.as_unit('ns').value)
+
+
+# Cached: clients send the same handful of range presets over and over
+_parse_iso_date_i8 = lru_cache(maxsize=1024)(_date_to_i8)
+
+
+def _parse_date_i8(date):
+    """Parse a date string to int64 nanoseconds, memoizing absolute ISO dates only"""
+    # Relative inputs such as 'today' or 'now' must be re-evaluated every time
+    if ISO_DATE_RE.fullmatch(date):
+        return _parse_iso_date_i8(date)
+    return _date_to_i8(date)
+
+
+def _read_only(array):
+    """Mark an array as immutable once it is shared across requests and workers"""
+    array.flags.writeable = False
+    return array
+
+
+def _days_to_i8(days):
+    """Convert a number of days to int64 nanoseconds"""
+    return np.timedelta64(days, 'D').astype('timedelta64[ns]').view('i8')
+
+
+def _nan_mean(values):
+    """Mean ignoring NaNs, NaN when there are no valid values (like pandas)"""
+    valid = values[~np.isnan(values)]
+    return float(valid.mean()) if valid.size > 0 else float('nan')
+
+
+def _nan_std(values):
+    """Sample standard deviation ignoring NaNs, NaN for fewer than two values"""
+    valid = values[~np.isnan(values)]
+    return float(valid.std(ddof=1)) if valid.size > 1 else float('nan')
+
+@njit
+def _window_push(state, values, i, window):
+    """Slide a Welford window [count, mean, m2, nan_count] forward to end at values[i]"""
+    x = values[i]
+    if math.isnan(x):
+        state[3] += 1
+    else:
+        state[0] += 1
+        delta = x - state[1]
+        state[1] += delta / state[0]
+        state[2] += delta * (x - state[1])
+    
+    if i >= window:
+        y = values[i - window]
+        if math.isnan(y):
+            state[3] -= 1
+        elif state[0] == 1:
+            state[0] = 0
+            state[1] = 0.0
+            state[2] = 0.0
+        else:
+            state[0] -= 1
+            delta = y - state[1]
+            state[1] -= delta / state[0]
+            state[2] -= delta * (y - state[1])
+
+
+@njit(error_model='numpy')
+def _price_metrics(prices):
+    """Daily return (%), 30-day volatility and 30/90-day moving averages in one pass
+    
+    Matches pandas' pct_change() and rolling(window) defaults: a window that is
+    not full or contains a NaN yields NaN, and volatility uses ddof=1.
+    """
+    n = prices.size
+    daily_return = np.full(n, np.nan)
+    volatility = np.full(n, np.nan)
+    ma_30 = np.full(n, np.nan)
+    ma_90 = np.full(n, np.nan)
+    
+    return_window = np.zeros(4)
+    price_window_30 = np.zeros(4)
+    price_window_90 = np.zeros(4)
+    
+    for i in range(n):
+        if i > 0:
+            daily_return[i] = (prices[i] / prices[i - 1] - 1.0) * 100.0
+        
+        _window_push(return_window, daily_return, i, 30)
+        _window_push(price_window_30, prices, i, 30)
+        _window_push(price_window_90, prices, i, 90)
+        
+        if i >= 29 and return_window[3] == 0:
+            volatility[i] = math.sqrt(max(return_window[2], 0.0) / (return_window[0] - 1))
+        if i >= 29 and price_window_30[3] == 0:
+            ma_30[i] = price_window_30[1]
+        if i >= 89 and price_window_90[3] == 0:
+            ma_90[i] = price_window_90[1]
+    
+    return daily_return, volatility, ma_30, ma_90
+
+# How long a computed dashboard summary is served before it is refreshed
+SUMMARY_TTL_SECONDS = 3600
+
+# Numeric oil price columns served by /api/oil-prices
+PRICE_COLUMNS = ['Price', 'Log_Price', 'Daily_Return', 'Volatility', 'MA_30', 'MA_90']
+
+# Oil price responses longer than this are streamed in chunks of this many rows
+STREAM_CHUNK_ROWS = 4096
+
+# Binary columnar format offered by /api/oil-prices via content negotiation
+ARROW_MIMETYPE = 'application/vnd.apache.arrow.stream'
 
 class DataProcessor:
     """Class to handle data processing and analysis results"""
@@ -33,6 +241,22 @@ class DataProcessor:
         self.oil_data = None
         self.events_data = None
         self.change_points = None
+        self._events_payloads = {}
+        self._events_empty_payload = None
+        self._change_points_payload = None
+        self._summary_payload = None
+        self._summary_ts = 0.0
+        self._analysis_payloads = {}
+        self._events_by_id = {}
+        self._event_date_i8 = {}
+        self._event_columns = {}
+        self._event_dates_i8 = None
+        self._dates_i8 = None
+        self._date_str = None
+        self._columns = {}
+        self._price_cumsum = None
+        self._price_counts = None
+        self._oil_table = None
         self.load_data()
     
     def load_data(self):
@@ -46,11 +270,7 @@ class DataProcessor:
                 self.oil_data = self.oil_data.sort_values('Date').reset_index(drop=True)
                 
                 # Calculate additional metrics
-                self.oil_data['Log_Price'] = np.log(self.oil_data['Price'])
-                self.oil_data['Daily_Return'] = self.oil_data['Price'].pct_change() * 100
-                self.oil_data['Volatility'] = self.oil_data['Daily_Return'].rolling(30).std()
-                self.oil_data['MA_30'] = self.oil_data['Price'].rolling(30).mean()
-                self.oil_data['MA_90'] = self.oil_data['Price'].rolling(90).mean()
+                self.add_price_metrics()
             else:
                 # Generate sample data if file doesn't exist
                 self.generate_sample_data()
@@ -63,7 +283,14 @@ class DataProcessor:
             
         except Exception as e:
             print(f"Error loading data: {e}")
+            # Fall back to a fully initialised processor so the payloads below can be built
             self.generate_sample_data()
+            self.load_events_data()
+            self.generate_change_points()
+        
+        # Serialize the static responses once for the lifetime of the process
+        self.build_price_columns()
+        self.precompute_payloads()
     
     def generate_sample_data(self):
         """Generate realistic sample oil price data"""
@@ -80,21 +307,16 @@ class DataProcessor:
         breaks = [2000, 4000, 6000, 8000, 10000]
         price_shifts = [0, 15, -20, 30, -15, 10]
         
-        prices = np.full(n_days, base_price)
-        current_shift = 0
+        shifts = np.zeros(n_days)
+        shifts[breaks] = price_shifts[1:]
+        current_shift = np.cumsum(shifts)
         
-        for i in range(n_days):
-            # Add breaks
-            for j, break_point in enumerate(breaks):
-                if i == break_point:
-                    current_shift += price_shifts[j+1]
-            
-            # Calculate price with trend, shifts, and volatility
-            prices[i] = base_price + trend[i] + current_shift + volatility[i]
-            
-            # Ensure prices stay positive
-            if prices[i] < 5:
-                prices[i] = 5 + np.random.exponential(5)
+        # Calculate price with trend, shifts, and volatility (whole-dollar prices)
+        prices = (base_price + trend + current_shift + volatility).astype(int)
+        
+        # Ensure prices stay positive
+        too_low = prices < 5
+        prices[too_low] = 5 + np.random.exponential(5, too_low.sum())
         
         self.oil_data = pd.DataFrame({
             'Date': dates,
@@ -102,11 +324,18 @@ class DataProcessor:
         })
         
         # Calculate additional metrics
-        self.oil_data['Log_Price'] = np.log(self.oil_data['Price'])
-        self.oil_data['Daily_Return'] = self.oil_data['Price'].pct_change() * 100
-        self.oil_data['Volatility'] = self.oil_data['Daily_Return'].rolling(30).std()
-        self.oil_data['MA_30'] = self.oil_data['Price'].rolling(30).mean()
-        self.oil_data['MA_90'] = self.oil_data['Price'].rolling(90).mean()
+        self.add_price_metrics()
+    
+    def add_price_metrics(self):
+        """Add log price, daily return, volatility and moving average columns"""
+        prices = self.oil_data['Price'].to_numpy(dtype=np.float64)
+        daily_return, volatility, ma_30, ma_90 = _price_metrics(prices)
+        
+        self.oil_data['Log_Price'] = np.log(prices)
+        self.oil_data['Daily_Return'] = daily_return
+        self.oil_data['Volatility'] = volatility
+        self.oil_data['MA_30'] = ma_30
+        self.oil_data['MA_90'] = ma_90
     
     def load_events_data(self):
         """Load geopolitical events data"""
@@ -232,6 +461,17 @@ class DataProcessor:
         
         self.events_data = pd.DataFrame(events_data)
         self.events_data['date'] = pd.to_datetime(self.events_data['date'])
+        
+        # Raw event records for O(1) lookup by id
+        self._events_by_id = {event['id']: event for event in events_data}
+        self._event_date_i8 = {event['id']: _parse_date_i8(event['date']) for event in events_data}
+        
+        # Column arrays in events_data row order for vectorized analysis
+        self._event_columns = {
+            field: _read_only(np.array([event[field] for event in events_data], dtype=object))
+            for field in ('id', 'event', 'type', 'date')
+        }
+        self._event_dates_i8 = _read_only(np.array([self._event_date_i8[event['id']] for event in events_data]))
     
     def generate_change_points(self):
         """Generate sample change points from Bayesian analysis"""
@@ -271,177 +511,225 @@ class DataProcessor:
             }
         ]
 
-# Initialize data processor
-data_processor = DataProcessor()
-
-@app.route('/api/health')
-def health_check():
-    """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
-
-@app.route('/api/oil-prices')
-def get_oil_prices():
-    """Get oil price data with optional date filtering"""
-    try:
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        
-        df = data_processor.oil_data.copy()
+    def build_price_columns(self):
+        """Cache the oil price data as contiguous, read-only per-column arrays"""
+        dates = self.oil_data['Date']
+        self._dates_i8 = _read_only(dates.values.astype('datetime64[ns]').view('i8'))
+        self._date_str = _read_only(dates.dt.strftime('%Y-%m-%d').to_numpy(dtype=object))
+        # float32 is ample precision for display and halves the bytes sliced and serialized
+        self._columns = {
+            name: _read_only(self.oil_data[name].to_numpy(dtype=np.float32))
+            for name in PRICE_COLUMNS
+        }
+        self._oil_table = pa.table({
+            'Date': pa.array(self._date_str, type=pa.string()),
+            **self._columns
+        })
         
-        # Apply date filters if provided
-        if start_date:
-            df = df[df['Date'] >= pd.to_datetime(start_date)]
-        if end_date:
-            df = df[df['Date'] <= pd.to_datetime(end_date)]
+        # Prefix sums so the mean price of any row range is O(1), kept at full precision
+        prices = self.oil_data['Price'].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(prices)
+        self._price_cumsum = _read_only(np.concatenate(([0.0], np.cumsum(np.where(valid, prices, 0.0)))))
+        self._price_counts = _read_only(np.concatenate(([0], np.cumsum(valid))))
+    
+    def oil_prices_arrow(self, lo, hi):
+        """Serialize a slice of the oil price table as an Arrow IPC stream"""
+        table = self._oil_table.slice(lo, hi - lo)
+        sink = pa.BufferOutputStream()
+        with ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    
+    def oil_prices_document(self, lo, hi):
+        """Build the /api/oil-prices response for a slice of rows"""
+        dates = self._date_str[lo:hi]
+        data = {'Date': dates.tolist()}
+        for name, values in self._columns.items():
+            data[name] = values[lo:hi]
         
-        # Convert to JSON format
-        df_json = df.copy()
-        df_json['Date'] = df_json['Date'].dt.strftime('%Y-%m-%d')
+        return {
+            'data': data,
+            'total_records': hi - lo,
+            'date_range': {
+                'start': dates[0] if hi > lo else None,
+                'end': dates[-1] if hi > lo else None
+            }
+        }
+    
+    def iter_oil_prices_json(self, lo, hi):
+        """Yield the same JSON as oil_prices_document, serialized a chunk of rows at a time"""
+        yield b'{"data":{'
+        columns = [('Date', self._date_str)] + list(self._columns.items())
+        for n, (name, values) in enumerate(columns):
+            yield (b',' if n else b'') + dump_json(name) + b':['
+            for start in range(lo, hi, STREAM_CHUNK_ROWS):
+                chunk = dump_json(values[start:min(start + STREAM_CHUNK_ROWS, hi)])
+                yield (b',' if start > lo else b'') + chunk[1:-1]
+            yield b']'
         
-        return jsonify({
-            'data': df_json.to_dict('records'),
-            'total_records': len(df_json),
+        # Remaining top-level fields, spliced in after the data object
+        summary = {
+            'total_records': hi - lo,
             'date_range': {
-                'start': df_json['Date'].min() if len(df_json) > 0 else None,
-                'end': df_json['Date'].max() if len(df_json) > 0 else None
+                'start': self._date_str[lo] if hi > lo else None,
+                'end': self._date_str[hi - 1] if hi > lo else None
             }
-        })
+        }
+        yield b'},' + dump_json(summary)[1:]
     
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/events')
-def get_events():
-    """Get geopolitical events data"""
-    try:
-        event_type = request.args.get('type')
-        impact_level = request.args.get('impact')
+    def date_bounds(self, start_date=None, end_date=None):
+        """Get the [lo, hi) row slice of oil data between two inclusive dates"""
+        start_i8 = _parse_date_i8(start_date) if start_date else None
+        end_i8 = _parse_date_i8(end_date) if end_date else None
+        return self.row_bounds(start_i8, end_i8)
+    
+    def row_bounds(self, start_i8=None, end_i8=None):
+        """Get the [lo, hi) row slice between two inclusive int64 nanosecond dates"""
+        lo, hi = 0, len(self._dates_i8)
+        if start_i8 is not None:
+            lo = int(np.searchsorted(self._dates_i8, start_i8, side='left'))
+        if end_i8 is not None:
+            hi = int(np.searchsorted(self._dates_i8, end_i8, side='right'))
+        return lo, max(lo, hi)
+    
+    def split_bounds(self, date_i8, lo, hi):
+        """Get the first row in [lo, hi) on or after an int64 nanosecond date"""
+        mid = int(np.searchsorted(self._dates_i8, date_i8, side='left'))
+        return min(max(mid, lo), hi)
+    
+    def event_price_impacts(self, days):
+        """Percentage change between the mean price in the `days` before and after each event"""
+        event_i8 = self._event_dates_i8
+        window = _days_to_i8(days)
+        
+        # Window bounds for all events at once: [lo, mid) before, [mid, hi) after
+        lo = np.searchsorted(self._dates_i8, event_i8 - window, side='left')
+        mid = np.searchsorted(self._dates_i8, event_i8, side='left')
+        hi = np.searchsorted(self._dates_i8, event_i8 + window, side='right')
         
-        df = data_processor.events_data.copy()
+        cumsum, counts = self._price_cumsum, self._price_counts
+        with np.errstate(divide='ignore', invalid='ignore'):
+            before_price = (cumsum[mid] - cumsum[lo]) / (counts[mid] - counts[lo])
+            after_price = (cumsum[hi] - cumsum[mid]) / (counts[hi] - counts[mid])
+            return ((after_price - before_price) / before_price) * 100
+    
+    def precompute_payloads(self):
+        """Serialize the events and change points responses ahead of time"""
+        events = self.events_data.copy()
+        events['date'] = events['date'].dt.strftime('%Y-%m-%d')
+        event_types = self.events_data['type'].unique().tolist()
+        impact_levels = self.events_data['impact'].unique().tolist()
         
-        # Apply filters
-        if event_type:
-            df = df[df['type'] == event_type]
-        if impact_level:
-            df = df[df['impact'] == impact_level]
+        def events_payload(df):
+            return CachedPayload({
+                'data': df.to_dict('records'),
+                'total_records': len(df),
+                'event_types': event_types,
+                'impact_levels': impact_levels
+            })
         
-        # Convert to JSON format
-        df_json = df.copy()
-        df_json['date'] = df_json['date'].dt.strftime('%Y-%m-%d')
+        # One payload per (type, impact) filter combination, None meaning unfiltered
+        self._events_payloads = {}
+        for event_type in [None] + event_types:
+            for impact_level in [None] + impact_levels:
+                df = events
+                if event_type:
+                    df = df[df['type'] == event_type]
+                if impact_level:
+                    df = df[df['impact'] == impact_level]
+                self._events_payloads[(event_type, impact_level)] = events_payload(df)
+        self._events_empty_payload = events_payload(events.iloc[0:0])
         
-        return jsonify({
-            'data': df_json.to_dict('records'),
-            'total_records': len(df_json),
-            'event_types': data_processor.events_data['type'].unique().tolist(),
-            'impact_levels': data_processor.events_data['impact'].unique().tolist()
+        self._change_points_payload = CachedPayload({
+            'data': self.change_points,
+            'total_records': len(self.change_points)
         })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/change-points')
-def get_change_points():
-    """Get Bayesian change points data"""
-    try:
-        return jsonify({
-            'data': data_processor.change_points,
-            'total_records': len(data_processor.change_points)
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/price-analysis/<event_id>')
-def get_price_analysis(event_id):
-    """Get detailed price analysis around a specific event"""
-    try:
-        event_id = int(event_id)
-        event = data_processor.events_data[data_processor.events_data['id'] == event_id]
         
-        if event.empty:
-            return jsonify({'error': 'Event not found'}), 404
+        self._summary_payload = CachedPayload(self.compute_summary())
+        self._summary_ts = time.monotonic()
         
-        event = event.iloc[0]
-        event_date = event['date']
+        # Per-event price analysis is a pure function of the event id
+        self._analysis_payloads = {}
+        for event_id, event in self._events_by_id.items():
+            analysis = self.compute_price_analysis(event)
+            if analysis is None:
+                cached = (CachedPayload({'error': 'No price data available for this period'}), 404)
+            else:
+                cached = (CachedPayload(analysis), 200)
+            self._analysis_payloads[event_id] = cached
+    
+    def compute_price_analysis(self, event):
+        """Analyze prices 30 days either side of an event, None if there is no price data"""
+        event_i8 = self._event_date_i8[event['id']]
         
         # Get price data around the event (30 days before and after)
-        start_date = event_date - timedelta(days=30)
-        end_date = event_date + timedelta(days=30)
-        
-        price_data = data_processor.oil_data[
-            (data_processor.oil_data['Date'] >= start_date) &
-            (data_processor.oil_data['Date'] <= end_date)
-        ].copy()
+        window = _days_to_i8(30)
+        lo, hi = self.row_bounds(event_i8 - window, event_i8 + window)
         
-        if price_data.empty:
-            return jsonify({'error': 'No price data available for this period'}), 404
+        if hi == lo:
+            return None
         
         # Calculate before/after statistics
-        before_data = price_data[price_data['Date'] < event_date]
-        after_data = price_data[price_data['Date'] >= event_date]
-
-        def convert_types(obj):
-            if isinstance(obj, (np.integer, pd.Int64Dtype)):
-                return int(obj)
-            if isinstance(obj, (np.floating, pd.Float64Dtype)):
-                return float(obj)
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-            return obj
+        mid = self.split_bounds(event_i8, lo, hi)
+        # Statistics come from the full-precision frame, not the float32 served columns
+        prices = self.oil_data['Price'].to_numpy(dtype=np.float64)
+        returns = self.oil_data['Daily_Return'].to_numpy(dtype=np.float64)
+        before_days = mid - lo
+        after_days = hi - mid
+        before_price = _nan_mean(prices[lo:mid]) if before_days else None
+        after_price = _nan_mean(prices[mid:hi]) if after_days else None
+        before_volatility = _nan_std(returns[lo:mid]) if before_days else None
+        after_volatility = _nan_std(returns[mid:hi]) if after_days else None
 
         analysis = {
             'event_info': {
-                'id': convert_types(event['id']),
+                'id': event['id'],
                 'event': event['event'],
-                'date': event_date.strftime('%Y-%m-%d'),
+                'date': event['date'],
                 'type': event['type'],
                 'description': event['description']
             },
-            'price_data': [
-                {
-                    'Date': pd.to_datetime(rec['Date']).strftime('%Y-%m-%d'),
-                    'Price': convert_types(rec['Price']),
-                    'Daily_Return': convert_types(rec['Daily_Return']),
-                    'Volatility': convert_types(rec['Volatility'])
-                }
-                for rec in price_data[['Date', 'Price', 'Daily_Return', 'Volatility']].to_dict('records')
-            ],
+            'price_data': {
+                'Date': self._date_str[lo:hi],
+                'Price': self._columns['Price'][lo:hi],
+                'Daily_Return': self._columns['Daily_Return'][lo:hi],
+                'Volatility': self._columns['Volatility'][lo:hi]
+            },
             'statistics': {
                 'before_event': {
-                    'avg_price': float(before_data['Price'].mean()) if not before_data.empty else None,
-                    'volatility': float(before_data['Daily_Return'].std()) if not before_data.empty else None,
-                    'days': int(len(before_data))
+                    'avg_price': before_price,
+                    'volatility': before_volatility,
+                    'days': before_days
                 },
                 'after_event': {
-                    'avg_price': float(after_data['Price'].mean()) if not after_data.empty else None,
-                    'volatility': float(after_data['Daily_Return'].std()) if not after_data.empty else None,
-                    'days': int(len(after_data))
+                    'avg_price': after_price,
+                    'volatility': after_volatility,
+                    'days': after_days
                 }
             }
         }
 
         # Calculate impact metrics
-        if not before_data.empty and not after_data.empty:
-            price_change = after_data['Price'].mean() - before_data['Price'].mean()
-            price_change_pct = (price_change / before_data['Price'].mean()) * 100
+        if before_days and after_days:
+            price_change = after_price - before_price
+            price_change_pct = (price_change / before_price) * 100
 
             analysis['impact'] = {
-                'price_change': float(price_change),
-                'price_change_pct': float(price_change_pct),
-                'volatility_change': float(after_data['Daily_Return'].std() - before_data['Daily_Return'].std())
+                'price_change': price_change,
+                'price_change_pct': price_change_pct,
+                'volatility_change': after_volatility - before_volatility
             }
 
-        return jsonify(analysis)
+        return analysis
     
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/dashboard-summary')
-def get_dashboard_summary():
-    """Get summary statistics for the dashboard"""
-    try:
-        oil_data = data_processor.oil_data
-        events_data = data_processor.events_data
+    def analysis_payload(self, event_id):
+        """Get the serialized price analysis and HTTP status for an event, None if unknown"""
+        return self._analysis_payloads.get(event_id)
+    
+    def compute_summary(self):
+        """Compute the dashboard summary statistics"""
+        oil_data = self.oil_data
+        events_data = self.events_data
         
         # Calculate key metrics
         current_price = float(oil_data['Price'].iloc[-1])
@@ -476,11 +764,110 @@ def get_dashboard_summary():
                 'total_events': len(events_data)
             },
             'recent_events': len(recent_events),
-            'change_points': len(data_processor.change_points),
+            'change_points': len(self.change_points),
             'event_types': events_data['type'].value_counts().to_dict()
         }
         
-        return jsonify(summary)
+        return summary
+    
+    def summary_payload(self):
+        """Get the serialized dashboard summary, recomputing it once it goes stale"""
+        # YTD return and recent events depend on the current date
+        if time.monotonic() - self._summary_ts > SUMMARY_TTL_SECONDS:
+            self._summary_payload = CachedPayload(self.compute_summary())
+            self._summary_ts = time.monotonic()
+        return self._summary_payload
+    
+    def events_payload(self, event_type=None, impact_level=None):
+        """Get the serialized events response for the given filters"""
+        return self._events_payloads.get(
+            (event_type or None, impact_level or None),
+            self._events_empty_payload
+        )
+
+# Initialize data processor
+data_processor = DataProcessor()
+
+@app.route('/api/health')
+def health_check():
+    """Health check endpoint"""
+    return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
+
+@app.route('/api/oil-prices')
+def get_oil_prices():
+    """Get oil price data with optional date filtering"""
+    response = make_response(_oil_prices_response())
+    # The body is JSON or Arrow depending on Accept, so caches must key on it
+    response.vary.add('Accept')
+    return response
+
+def _oil_prices_response():
+    """Build the /api/oil-prices response in the format the client asked for"""
+    try:
+        start_date = request.args.get('start_date')
+        end_date = request.args.get('end_date')
+        
+        lo, hi = data_processor.date_bounds(start_date, end_date)
+        
+        # Clients that ask for Arrow get the binary table; JSON stays the default
+        if request.accept_mimetypes.best_match(['application/json', ARROW_MIMETYPE]) == ARROW_MIMETYPE:
+            return app.response_class(data_processor.oil_prices_arrow(lo, hi), mimetype=ARROW_MIMETYPE)
+        
+        # Stream large ranges so the whole payload is never held in memory at once
+        if hi - lo > STREAM_CHUNK_ROWS:
+            return app.response_class(data_processor.iter_oil_prices_json(lo, hi), mimetype='application/json')
+        
+        # Columnar payload: one array per field instead of one object per row
+        payload = dump_json(data_processor.oil_prices_document(lo, hi))
+        return app.response_class(payload, mimetype='application/json')
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/events')
+def get_events():
+    """Get geopolitical events data"""
+    try:
+        event_type = request.args.get('type')
+        impact_level = request.args.get('impact')
+        
+        return cached_json_response(data_processor.events_payload(event_type, impact_level))
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/change-points')
+def get_change_points():
+    """Get Bayesian change points data"""
+    try:
+        return cached_json_response(data_processor._change_points_payload)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/price-analysis/<event_id>')
+def get_price_analysis(event_id):
+    """Get detailed price analysis around a specific event"""
+    try:
+        event_id = int(event_id)
+        cached = data_processor.analysis_payload(event_id)
+        
+        if cached is None:
+            return jsonify({'error': 'Event not found'}), 404
+        
+        payload, status = cached
+        response = cached_json_response(payload)
+        response.status_code = status
+        return response
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/dashboard-summary')
+def get_dashboard_summary():
+    """Get summary statistics for the dashboard"""
+    try:
+        return cached_json_response(data_processor.summary_payload())
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -491,34 +878,20 @@ def get_correlation_analysis():
     try:
         correlations = []
         
-        for _, event in data_processor.events_data.iterrows():
-            event_date = event['date']
-            
-            # Get price data around event
-            start_date = event_date - timedelta(days=5)
-            end_date = event_date + timedelta(days=5)
-            
-            price_data = data_processor.oil_data[
-                (data_processor.oil_data['Date'] >= start_date) &
-                (data_processor.oil_data['Date'] <= end_date)
-            ]
-            
-            if not price_data.empty:
-                # Calculate price impact
-                before_price = price_data[price_data['Date'] < event_date]['Price'].mean()
-                after_price = price_data[price_data['Date'] >= event_date]['Price'].mean()
-                
-                if not pd.isna(before_price) and not pd.isna(after_price):
-                    impact = ((after_price - before_price) / before_price) * 100
-                    
-                    correlations.append({
-                        'event_id': event['id'],
-                        'event': event['event'],
-                        'type': event['type'],
-                        'date': event_date.strftime('%Y-%m-%d'),
-                        'impact_percentage': float(impact),
-                        'magnitude': abs(float(impact))
-                    })
+        impacts = data_processor.event_price_impacts(days=5)
+        
+        events = data_processor._event_columns
+        
+        for i in np.flatnonzero(~np.isnan(impacts)):
+            impact = float(impacts[i])
+            correlations.append({
+                'event_id': events['id'][i],
+                'event': events['event'][i],
+                'type': events['type'][i],
+                'date': events['date'][i],
+                'impact_percentage': impact,
+                'magnitude': abs(impact)
+            })
         
         # Sort by magnitude
         correlations.sort(key=lambda x: x['magnitude'], reverse=True)
@@ -547,4 +920,9 @@ if __name__ == '__main__':
     print("   - /api/dashboard-summary")
     print("   - /api/correlation-analysis")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    if os.environ.get('FLASK_DEBUG') == '1':
+        # Werkzeug development server with the reloader and debugger
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=8)
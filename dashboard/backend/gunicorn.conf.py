@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for the GeoBrent Dashboard Backend
+
+Usage (from dashboard/backend):
+    gunicorn app:app
+"""
+
+import gc
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# One worker process per core, each with a small thread pool
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Load the app (and its DataProcessor) once in the master before forking,
+# so workers share the precomputed data through copy-on-write pages
+preload_app = True
+
+
+def pre_fork(server, worker):
+    """Move everything allocated during preload out of the GC's reach
+
+    Collections in a worker would otherwise touch the headers of every
+    preloaded object and un-share their copy-on-write pages.
+    """
+    gc.freeze()
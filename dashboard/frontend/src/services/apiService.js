@@ -2,6 +2,21 @@ import axios from 'axios';
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:5000/api';
 
+// Convert a columnar payload ({ field: [values] }) into an array of row objects
+const columnsToRecords = (columns) => {
+    const fields = Object.keys(columns);
+    const length = fields.length ? columns[fields[0]].length : 0;
+    const records = new Array(length);
+    for (let i = 0; i < length; i++) {
+        const record = {};
+        for (const field of fields) {
+            record[field] = columns[field][i];
+        }
+        records[i] = record;
+    }
+    return records;
+};
+
 class ApiService {
     constructor() {
         this.api = axios.create({
@@ -46,7 +61,8 @@ class ApiService {
         if (startDate) params.start_date = startDate;
         if (endDate) params.end_date = endDate;
 
-        return this.api.get('/oil-prices', { params });
+        const response = await this.api.get('/oil-prices', { params });
+        return { ...response, data: columnsToRecords(response.data) };
     }
 
     // Get events data
@@ -0,0 +1,47 @@
+import gzip
+
+import brotli
+import orjson
+
+from dashboard.backend import app as backend
+
+client = backend.app.test_client()
+
+
+def get(url, accept_encoding):
+    return client.get(url, headers={'Accept-Encoding': accept_encoding})
+
+
+def test_refused_gzip_is_not_used():
+    response = get('/api/events', 'gzip;q=0')
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_data() == backend.data_processor.events_payload().body
+
+
+def test_all_codings_refused_leaves_body_uncompressed():
+    response = get('/api/events', 'gzip;q=0, br;q=0')
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_cached_gzip_body_is_served():
+    payload = backend.data_processor.events_payload()
+    response = get('/api/events', 'gzip')
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert response.get_data() == payload.gzipped
+    assert gzip.decompress(response.get_data()) == payload.body
+
+
+def test_br_only_client_gets_brotli():
+    response = get('/api/events', 'br')
+    assert response.headers['Content-Encoding'] == 'br'
+    assert brotli.decompress(response.get_data()) == backend.data_processor.events_payload().body
+
+
+def test_small_bodies_stay_uncompressed():
+    payload = backend.data_processor._change_points_payload
+    assert len(payload.body) < backend.app.config['COMPRESS_MIN_SIZE']
+    for accept_encoding in ('gzip', 'br', 'gzip, deflate, br'):
+        response = get('/api/change-points', accept_encoding)
+        assert 'Content-Encoding' not in response.headers
+        assert orjson.loads(response.get_data()) == orjson.loads(payload.body)
@@ -0,0 +1,34 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from dashboard.backend import app as backend
+
+
+def test_load_data_falls_back_to_sample_data_on_error(monkeypatch):
+    # A CSV without a Price column makes the metric calculations raise
+    exists = os.path.exists
+    monkeypatch.setattr(os.path, 'exists', lambda path: path.endswith('BrentOilPrices.csv') or exists(path))
+    monkeypatch.setattr(pd, 'read_csv', lambda path: pd.DataFrame({'Date': ['2020-01-01', '2020-01-02']}))
+
+    processor = backend.DataProcessor()
+
+    assert len(processor.oil_data) > 2
+    assert len(processor.events_data) == 13
+    assert len(processor.change_points) == 4
+    assert processor.events_payload() is not None
+    assert processor.analysis_payload(1) is not None
+
+
+def test_parse_date_clamps_out_of_range_dates():
+    assert backend._parse_date_i8('1000-01-01') == np.iinfo(np.int64).min
+    assert backend._parse_date_i8('3000-01-01') == np.iinfo(np.int64).max
+    assert backend._parse_date_i8('2020/01/01') == backend._parse_date_i8('2020-01-01')
+
+
+def test_parse_date_does_not_memoize_relative_dates():
+    first = backend._parse_date_i8('now')
+    time.sleep(0.001)
+    assert backend._parse_date_i8('now') > first
@@ -0,0 +1,36 @@
+import orjson
+import pytest
+
+from dashboard.backend import app as backend
+
+CHUNK = backend.STREAM_CHUNK_ROWS
+processor = backend.data_processor
+TOTAL = len(processor._dates_i8)
+
+
+@pytest.mark.parametrize('lo, hi', [
+    (0, 0),
+    (100, 100),
+    (0, 1),
+    (0, CHUNK - 1),
+    (0, CHUNK),
+    (0, CHUNK + 1),
+    (0, 2 * CHUNK),
+    (0, 2 * CHUNK + 1),
+    (7, 7 + 2 * CHUNK),
+    (TOTAL - CHUNK - 1, TOTAL),
+    (0, TOTAL),
+])
+def test_streamed_json_matches_document(lo, hi):
+    streamed = b''.join(processor.iter_oil_prices_json(lo, hi))
+    expected = backend.dump_json(processor.oil_prices_document(lo, hi))
+    assert orjson.loads(streamed) == orjson.loads(expected)
+
+
+def test_large_range_is_streamed():
+    client = backend.app.test_client()
+    response = client.get('/api/oil-prices', headers={'Accept-Encoding': 'identity'})
+    assert response.is_streamed
+    assert orjson.loads(response.get_data()) == orjson.loads(
+        backend.dump_json(processor.oil_prices_document(0, TOTAL))
+    )
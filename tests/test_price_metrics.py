@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.backend.app import _price_metrics
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_price_metrics_match_pandas(seed):
+    rng = np.random.default_rng(seed)
+    prices = rng.uniform(10, 100, 500)
+    prices[rng.integers(0, 500, 5)] = np.nan
+
+    series = pd.Series(prices)
+    daily_return = series.pct_change(fill_method=None) * 100
+    expected = [
+        daily_return,
+        daily_return.rolling(30).std(),
+        series.rolling(30).mean(),
+        series.rolling(90).mean()
+    ]
+
+    for want, got in zip(expected, _price_metrics(prices)):
+        np.testing.assert_allclose(got, want.to_numpy(), rtol=1e-9, equal_nan=True)
+
+
+def test_price_metrics_short_series_is_all_nan_windows():
+    volatility, ma_30, ma_90 = _price_metrics(np.linspace(10, 20, 20))[1:]
+    assert np.isnan(volatility).all()
+    assert np.isnan(ma_30).all()
+    assert np.isnan(ma_90).all()